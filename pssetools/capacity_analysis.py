@@ -15,30 +15,38 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import dataclasses
+import functools
 import logging
 import math
+import tempfile
 from collections import defaultdict
 from collections.abc import Collection
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 from pprint import pprint
-from typing import Final, Iterator, Optional
+from typing import Callable, Final, Literal, Optional, Union, overload
 
+import numpy as np
+import numpy.typing as npt
 from tqdm import tqdm
 
 from pssetools import wrapped_funcs as wf
 from pssetools.contingency_analysis import (
+    Contingency,
     ContingencyScenario,
     LimitingFactor,
     LimitingSubsystem,
     get_contingency_limiting_factor,
     get_contingency_scenario,
+    get_enabled_contingency_scenario,
 )
+from pssetools.process_pool import get_chunksize, get_workers_count, init_worker
 from pssetools.subsystems import (
+    SWING_BUS_TYPE,
     Bus,
     Buses,
-    Load,
     Loads,
-    Machine,
     Machines,
     TemporaryBusLoad,
     TemporaryBusMachine,
@@ -49,11 +57,19 @@ from pssetools.violations_analysis import (
     Violations,
     ViolationsLimits,
     ViolationsStats,
+    ViolationTypeToLimitValue,
     check_violations,
+    check_violations_and_margin,
+    get_violations_margin,
     run_solver,
 )
 
 log = logging.getLogger(__name__)
+# The regula falsi probe is kept off the limits to shrink the interval
+# at least by this ratio
+MIN_PROBE_RATIO: Final[float] = 0.1
+# Progress bar postfix is refreshed once per this count of analysed buses
+PROGRESS_POSTFIX_INTERVAL: Final[int] = 16
 
 
 @dataclass
@@ -68,6 +84,28 @@ class BusHeadroom:
 
 
 Headroom = tuple[BusHeadroom, ...]
+# `BusHeadroom` fields except the bus
+BusHeadroomValues = tuple[
+    complex,
+    complex,
+    complex,
+    complex,
+    Optional[LimitingFactor],
+    Optional[LimitingFactor],
+]
+# Limiting factors are stored as `Violations` values, 0 if there is no one
+HEADROOM_DTYPE: Final[np.dtype] = np.dtype(
+    [
+        ("bus_number", np.int32),
+        ("actual_load_mva", np.complex128),
+        ("actual_gen_mva", np.complex128),
+        ("load_avail_mva", np.complex128),
+        ("gen_avail_mva", np.complex128),
+        ("load_lf_v", np.int32),
+        ("gen_lf_v", np.int32),
+    ]
+)
+HeadroomArray = npt.NDArray[np.void]
 
 
 @dataclass(frozen=True)
@@ -89,6 +127,23 @@ class UnfeasibleCondition:
     lf: LimitingFactor
 
 
+@dataclass
+class BusHeadroomResult:
+    """Bus headroom and stats collected by a worker process"""
+
+    bus_headroom_values: BusHeadroomValues
+    feasibility_stats: dict
+    contingency_stats: dict
+    violations_stats: ViolationTypeToLimitValue
+    power_flows_count: int
+
+
+@functools.lru_cache(maxsize=32)
+def _mva_limit(p_mw: float, power_factor: float) -> complex:
+    """Return PQ power in MVA for the active power and the power factor"""
+    return complex(p_mw, p_mw * math.tan(math.acos(power_factor)))
+
+
 class CapacityAnalyser:
     """This class is made to simplify arguments passing
     between the capacity analysis steps:
@@ -112,43 +167,74 @@ class CapacityAnalyser:
         normal_limits: Optional[ViolationsLimits],
         contingency_limits: Optional[ViolationsLimits],
         contingency_scenario: Optional[ContingencyScenario] = None,
+        max_workers: Optional[int] = None,
+        use_regula_falsi: bool = False,
+        skip_swing_buses_load: bool = False,
+        contingency_group_size: int = 1,
+        use_numba: bool = False,
+        limiting_contingency_first: bool = False,
     ):
         self._case_name: str = case_name
-        upper_load_limit_q_mw: Final[float] = upper_load_limit_p_mw * math.tan(
-            math.acos(load_power_factor)
-        )
-        self._upper_load_limit_mva: Final[complex] = (
-            upper_load_limit_p_mw + 1j * upper_load_limit_q_mw
+        # The source case is parsed once, later it is reloaded from the binary
+        # snapshot. See `reload_case()`.
+        self._case_snapshot_dir: Optional[tempfile.TemporaryDirectory] = None
+        self._case_snapshot_name: Optional[str] = None
+        self._upper_load_limit_mva: Final[complex] = _mva_limit(
+            upper_load_limit_p_mw, load_power_factor
         )
-        upper_gen_limit_q_mw: Final[float] = upper_gen_limit_p_mw * math.tan(
-            math.acos(gen_power_factor)
-        )
-        self._upper_gen_limit_mva: Final[complex] = (
-            upper_gen_limit_p_mw + 1j * upper_gen_limit_q_mw
+        self._upper_gen_limit_mva: Final[complex] = _mva_limit(
+            upper_gen_limit_p_mw, gen_power_factor
         )
         self._selected_buses_ids: Optional[Collection[int]] = selected_buses_ids
         self._headroom_tolerance_p_mw: Final[float] = headroom_tolerance_p_mw
         self._solver_opts: dict = solver_opts
         self._max_iterations: Final[int] = max_iterations
         self._normal_limits: Final[Optional[ViolationsLimits]] = normal_limits
+        # Limits are unpacked once, they are passed to every violations check
+        self._normal_limits_kwargs: Final[dict] = (
+            dataclasses.asdict(normal_limits) if normal_limits is not None else {}
+        )
         self._contingency_limits: Final[Optional[ViolationsLimits]] = contingency_limits
+        self._max_workers: Final[Optional[int]] = max_workers
+        self._use_regula_falsi: Final[bool] = use_regula_falsi
+        self._skip_swing_buses_load: Final[bool] = skip_swing_buses_load
+        self._contingency_group_size: Final[int] = contingency_group_size
+        self._next_probe: Final[NextProbe] = get_next_probe_func(use_numba)
+        self._limiting_contingency_first: Final[bool] = limiting_contingency_first
+        # The last contingency with violations is checked first on the next probes
+        # of the same search
+        self._last_limiting_contingency: Optional[Contingency] = None
         self._use_full_newton_raphson: Final[bool] = not self.fdns_is_applicable()
         self.check_base_case_violations()
+        self._base_case_margin: Final[float] = (
+            self.violations_margin() if self._use_regula_falsi else math.nan
+        )
         self._contingency_scenario: Final[
             ContingencyScenario
         ] = self.handle_empty_contingency_scenario(contingency_scenario)
-        self._loads_iterator: Iterator = iter(Loads())
-        self._loads_available: bool = True
-        try:
-            self._load: Load = next(self._loads_iterator)
-        except StopIteration:
-            self._loads_available = False
-        self._machines_iterator: Iterator = iter(Machines())
-        self._machines_available: bool = True
-        try:
-            self._machine: Machine = next(self._machines_iterator)
-        except StopIteration:
-            self._machines_available = False
+        self._load_by_bus: Final[dict[int, complex]] = Loads().aggregate_by_bus()
+        self._gen_by_bus: Final[dict[int, complex]] = Machines().aggregate_by_bus()
+        # The same analyser is built in every worker process
+        self._worker_kwargs: Final[dict] = dict(
+            case_name=self.case_snapshot_name,
+            upper_load_limit_p_mw=upper_load_limit_p_mw,
+            upper_gen_limit_p_mw=upper_gen_limit_p_mw,
+            load_power_factor=load_power_factor,
+            gen_power_factor=gen_power_factor,
+            selected_buses_ids=selected_buses_ids,
+            headroom_tolerance_p_mw=headroom_tolerance_p_mw,
+            solver_opts=solver_opts,
+            max_iterations=max_iterations,
+            normal_limits=normal_limits,
+            contingency_limits=contingency_limits,
+            contingency_scenario=self._contingency_scenario,
+            max_workers=1,
+            use_regula_falsi=use_regula_falsi,
+            skip_swing_buses_load=skip_swing_buses_load,
+            contingency_group_size=contingency_group_size,
+            use_numba=use_numba,
+            limiting_contingency_first=limiting_contingency_first,
+        )
 
     def fdns_is_applicable(self) -> bool:
         """Fixed slope Decoupled Newton-Raphson Solver (FDNS) is applicable"""
@@ -163,8 +249,38 @@ class CapacityAnalyser:
         log.info(f"Case solved")
         return is_applicable
 
+    @property
+    def case_snapshot_name(self) -> str:
+        """Return the case to be opened by the worker processes"""
+        return self._case_snapshot_name or self._case_name
+
     def reload_case(self) -> None:
+        """Reload the case, the first call opens the source case
+
+        The opened source case is saved to a temporary `.sav` snapshot,
+        that is loaded on the next calls without parsing the source case again.
+        """
+        if self._case_snapshot_name is not None:
+            wf.open_case(self._case_snapshot_name)
+            return
         wf.open_case(self._case_name)
+        if Path(self._case_name).suffix == ".sav":
+            self._case_snapshot_name = self._case_name
+        else:
+            self._case_snapshot_dir = tempfile.TemporaryDirectory(prefix="pssetools_")
+            case_snapshot_path: Path = Path(self._case_snapshot_dir.name) / "case.sav"
+            wf.save(str(case_snapshot_path))
+            self._case_snapshot_name = str(case_snapshot_path)
+
+    def reload_case_if_not_converged(
+        self, limiting_factor: Optional[LimitingFactor]
+    ) -> None:
+        """Reload the case to fix the solver state after failed solution"""
+        if (
+            limiting_factor is not None
+            and Violations.NOT_CONVERGED in limiting_factor.v
+        ):
+            self.reload_case()
 
     def check_base_case_violations(self) -> None:
         """Raise `RuntimeError` if base case has violations"""
@@ -177,169 +293,264 @@ class CapacityAnalyser:
     ) -> ContingencyScenario:
         """Returns new contingency scenario if none is provided"""
         if contingency_scenario is not None:
-            return contingency_scenario
+            # The statuses are checked once instead of every contingency check
+            return get_enabled_contingency_scenario(contingency_scenario)
         contingency_scenario = get_contingency_scenario(
             use_full_newton_raphson=self._use_full_newton_raphson,
             solver_opts=self._solver_opts,
             contingency_limits=self._contingency_limits,
+            case_name=self.case_snapshot_name,
+            max_workers=self._max_workers,
+            group_size=self._contingency_group_size,
         )
-        # Reopen file to fix potential solver problems after building contingency scenario
+        # The screening solutions leave taps and switched shunts adjusted,
+        # reopen the case, so the analysis starts from the same state as in workers
         self.reload_case()
+        run_solver(self._use_full_newton_raphson, self._solver_opts)
         return contingency_scenario
 
-    def buses_headroom(self) -> Headroom:
-        """Return actual load and max additional PQ power in MVA for each bus"""
-        buses: Buses = Buses()
-        print("Analysing headroom")
-        with tqdm(
-            total=len(buses)
+    @overload
+    def buses_headroom(self, legacy: Literal[True] = True) -> Headroom:
+        ...
+
+    @overload
+    def buses_headroom(self, legacy: Literal[False]) -> HeadroomArray:
+        ...
+
+    @overload
+    def buses_headroom(self, legacy: bool = True) -> Union[Headroom, HeadroomArray]:
+        ...
+
+    def buses_headroom(self, legacy: bool = True) -> Union[Headroom, HeadroomArray]:
+        """Return actual load and max additional PQ power in MVA for each bus
+
+        If `legacy` is not set, the headroom is returned as a structured array
+        with `HEADROOM_DTYPE`.
+        """
+        all_buses: Buses = Buses()
+        buses_indexes: tuple[int, ...] = tuple(
+            bus_idx
+            for bus_idx, bus in enumerate(all_buses)
             if self._selected_buses_ids is None
-            else len(self._selected_buses_ids),
-            postfix=[{}],
-        ) as progress:
+            or bus.number in self._selected_buses_ids
+        )
+        buses: tuple[Bus, ...] = tuple(all_buses[bus_idx] for bus_idx in buses_indexes)
+        print("Analysing headroom")
+        workers_count: Final[int] = get_workers_count(self._max_workers, len(buses))
+        headroom_values: list[BusHeadroomValues] = []
+        with tqdm(total=len(buses), mininterval=0.5) as progress:
             PowerFlows.reset_count()
             ViolationsStats.reset()
+            if workers_count == 1:
+                for bus_idx, bus in enumerate(buses):
+                    headroom_values.append(self.bus_headroom_values(bus))
+                    update_progress(progress, bus_idx, bus)
+            else:
+                # Weak buses take the most probes. They are submitted first
+                # (longest processing time first) to shorten the tail of the pool.
+                # The bus voltage is a proxy of the bus weakness.
+                voltages_pu: tuple[float, ...] = all_buses.get_voltage_pu(buses_indexes)
+                submission_order: list[int] = sorted(
+                    range(len(buses)), key=voltages_pu.__getitem__
+                )
+                results: dict[int, BusHeadroomResult] = {}
+                # Buses are analysed by worker processes, see `init_worker()`
+                with ProcessPoolExecutor(
+                    max_workers=workers_count,
+                    initializer=_init_headroom_worker,
+                    initargs=(self._worker_kwargs, self._use_full_newton_raphson),
+                ) as executor:
+                    result: BusHeadroomResult
+                    for progress_idx, (bus_idx, result) in enumerate(
+                        zip(
+                            submission_order,
+                            executor.map(
+                                _bus_headroom_worker,
+                                (buses[bus_idx] for bus_idx in submission_order),
+                                chunksize=get_chunksize(len(buses), workers_count),
+                            ),
+                        )
+                    ):
+                        PowerFlows.increment_count(result.power_flows_count)
+                        results[bus_idx] = result
+                        update_progress(progress, progress_idx, buses[bus_idx])
+                # Stats are merged in the buses order to keep the output stable
+                for bus_idx in range(len(buses)):
+                    result = results[bus_idx]
+                    CapacityAnalysisStats.merge(
+                        result.feasibility_stats, result.contingency_stats
+                    )
+                    ViolationsStats.merge(result.violations_stats)
+                    headroom_values.append(result.bus_headroom_values)
+        if legacy:
             return tuple(
-                self.bus_headroom(bus, progress)
-                for bus in buses
-                if self._selected_buses_ids is None
-                or bus.number in self._selected_buses_ids
+                BusHeadroom(bus, *values) for bus, values in zip(buses, headroom_values)
+            )
+        headroom_array: HeadroomArray = np.empty(len(buses), dtype=HEADROOM_DTYPE)
+        for bus_idx, (bus, values) in enumerate(zip(buses, headroom_values)):
+            headroom_array[bus_idx] = (
+                bus.number,
+                *values[:4],
+                get_violations_value(values[4]),
+                get_violations_value(values[5]),
             )
+        return headroom_array
 
-    def bus_headroom(self, bus: Bus, progress: tqdm) -> BusHeadroom:
+    def bus_headroom(self, bus: Bus) -> BusHeadroom:
         """Return bus actual load and max additional PQ power in MVA"""
+        return BusHeadroom(bus, *self.bus_headroom_values(bus))
+
+    def bus_headroom_values(self, bus: Bus) -> BusHeadroomValues:
+        """Return `BusHeadroom` values without building the dataclass"""
         actual_load_mva: complex = self.bus_actual_load_mva(bus.number)
         actual_gen_mva: complex = self.bus_actual_gen_mva(bus.number)
-        load_lf: Optional[LimitingFactor]
-        load_available_mva: complex
-        temp_load: TemporaryBusLoad = TemporaryBusLoad(bus)
-        load_available_mva, load_lf = self.max_power_available_mva(
-            temp_load, self._upper_load_limit_mva
+        load_lf: Optional[LimitingFactor] = None
+        load_available_mva: complex = 0j
+        load_is_skipped: Final[bool] = (
+            self._skip_swing_buses_load and bus.type == SWING_BUS_TYPE
         )
-        if (
-            load_available_mva == 0j
-            and load_lf is not None
-            and load_lf.v == Violations.NOT_CONVERGED
-        ):
-            self.reload_case()
+        if not load_is_skipped:
+            temp_load: TemporaryBusLoad = TemporaryBusLoad(bus)
+            load_available_mva, load_lf = self.max_power_available_mva(
+                temp_load, self._upper_load_limit_mva
+            )
         gen_available_mva: complex = 0j
         gen_lf: Optional[LimitingFactor] = None
-        if actual_gen_mva != 0 and load_available_mva != 0j:
+        if actual_gen_mva != 0 and (load_is_skipped or load_available_mva != 0j):
             temp_gen: TemporaryBusMachine = TemporaryBusMachine(bus)
             gen_available_mva, gen_lf = self.max_power_available_mva(
                 temp_gen, self._upper_gen_limit_mva
             )
-            if (
-                gen_available_mva == 0j
-                and gen_lf is not None
-                and gen_lf.v == Violations.NOT_CONVERGED
-            ):
-                self.reload_case()
-        progress.postfix[0]["bus_number"] = bus.number
-        progress.postfix[0]["power_flows"] = PowerFlows.count
-        progress.update()
-        return BusHeadroom(
-            bus=bus,
-            actual_load_mva=actual_load_mva,
-            actual_gen_mva=actual_gen_mva,
-            load_avail_mva=load_available_mva,
-            gen_avail_mva=gen_available_mva,
-            load_lf=load_lf,
-            gen_lf=gen_lf,
+        return (
+            actual_load_mva,
+            actual_gen_mva,
+            load_available_mva,
+            gen_available_mva,
+            load_lf,
+            gen_lf,
         )
 
     def bus_actual_load_mva(self, bus_number: int) -> complex:
         """Return sum of all bus loads"""
-        actual_load_mva: complex = 0j
-        # Buses and loads are sorted by bus number [PSSE API.pdf].
-        # So loads are iterated until load bus number is lower or equal
-        # to the bus number.
-        while self._loads_available and self._load.number <= bus_number:
-            if self._load.number == bus_number:
-                actual_load_mva += self._load.mva_act
-            try:
-                self._load = next(self._loads_iterator)
-            except StopIteration:
-                self._loads_available = False
-        return actual_load_mva
+        return self._load_by_bus.get(bus_number, 0j)
 
     def bus_actual_gen_mva(self, bus_number: int) -> complex:
         """Return sum of all bus generators"""
-        actual_gen_mva: complex = 0j
-        # Buses and machines are sorted by bus number [PSSE API.pdf].
-        # So machines are iterated until machine bus number is lower or equal
-        # to the bus number.
-        while self._machines_available and self._machine.number <= bus_number:
-            if self._machine.number == bus_number:
-                actual_gen_mva += self._machine.pq_gen
-            try:
-                self._machine = next(self._machines_iterator)
-            except StopIteration:
-                self._machines_available = False
-        return actual_gen_mva
+        return self._gen_by_bus.get(bus_number, 0j)
 
     def max_power_available_mva(
         self,
         temp_subsystem: TemporaryBusSubsystem,
         upper_limit_mva: complex,
     ) -> tuple[complex, Optional[LimitingFactor]]:
-        """Return max additional PQ power in MVA and a limiting factor"""
-        lower_limit_mva: complex = 0j
+        """Return max additional PQ power in MVA and a limiting factor
+
+        The search starts from the reloaded case, so the solver adjustments
+        (taps, switched shunts) of the previous searches don't affect it.
+        The solved case is kept between the probes to warm start the solver.
+        It is reloaded only if the solution has not converged.
+
+        Interpolated probes are safeguarded by bisection, so the interval
+        shrinks at least by half in every two probes.
+        """
+        self.reload_case()
+        # The search doesn't depend on the searches analysed before it
+        self._last_limiting_contingency = None
+        # Limits are kept as floats: no `complex` is built for the interval updates
+        lower_re: float = 0.0
+        lower_im: float = 0.0
+        upper_re: float = upper_limit_mva.real
+        upper_im: float = upper_limit_mva.imag
+        lower_margin: float = self._base_case_margin
+        upper_margin: float
         is_feasible: bool
         limiting_factor: Optional[LimitingFactor]
+        margin: float
         # If upper limit is available, return it immediately
         with temp_subsystem(upper_limit_mva):
-            is_feasible, limiting_factor = self.feasibility_check()
+            is_feasible, limiting_factor, upper_margin = self.feasibility_check()
         if is_feasible:
             return upper_limit_mva, limiting_factor
         CapacityAnalysisStats.update(temp_subsystem, limiting_factor)
-        self.reload_case()
+        self.reload_case_if_not_converged(limiting_factor)
+        previous_is_feasible: Optional[bool] = None
+        interval_p_mw: float = upper_re - lower_re
+        use_bisection: bool = False
         # First iteration was initial upper limit check. Subtract it.
         for _ in range(self._max_iterations - 1):
-            middle_mva: complex = (lower_limit_mva + upper_limit_mva) / 2
-            with temp_subsystem(middle_mva):
-                is_feasible, limiting_factor = self.feasibility_check()
+            probe_re: float
+            probe_im: float
+            # `nan` margins make `next_probe()` bisect the interval
+            probe_re, probe_im = self._next_probe(
+                lower_re,
+                lower_im,
+                upper_re,
+                upper_im,
+                math.nan if use_bisection else lower_margin,
+                math.nan if use_bisection else upper_margin,
+            )
+            with temp_subsystem(complex(probe_re, probe_im)):
+                is_feasible, limiting_factor, margin = self.feasibility_check()
             if is_feasible:
-                # Middle point is feasible: headroom is above
-                lower_limit_mva = middle_mva
+                # Probe is feasible: headroom is above
+                lower_re, lower_im, lower_margin = probe_re, probe_im, margin
+                if previous_is_feasible:
+                    # Illinois modification: the upper limit is retained twice
+                    upper_margin /= 2
             else:
-                # Middle point is NOT feasible: headroom is below
-                upper_limit_mva = middle_mva
+                # Probe is NOT feasible: headroom is below
+                upper_re, upper_im, upper_margin = probe_re, probe_im, margin
+                if previous_is_feasible is False:
+                    # Illinois modification: the lower limit is retained twice
+                    lower_margin /= 2
                 CapacityAnalysisStats.update(temp_subsystem, limiting_factor)
-                self.reload_case()
-            if (
-                upper_limit_mva.real - lower_limit_mva.real
-                < self._headroom_tolerance_p_mw
-            ):
+                self.reload_case_if_not_converged(limiting_factor)
+            previous_is_feasible = is_feasible
+            # Safeguard of regula falsi: if the interpolated probe hasn't halved
+            # the interval, the next probe bisects it
+            use_bisection = not use_bisection and (
+                upper_re - lower_re > interval_p_mw / 2
+            )
+            interval_p_mw = upper_re - lower_re
+            if interval_p_mw < self._headroom_tolerance_p_mw:
                 break
-        return lower_limit_mva, limiting_factor
+        return complex(lower_re, lower_im), limiting_factor
 
-    def feasibility_check(self) -> tuple[bool, Optional[LimitingFactor]]:
-        """Return `True` if feasible, else `False` with limiting factor"""
-        violations: Violations
+    def feasibility_check(
+        self,
+    ) -> tuple[bool, Optional[LimitingFactor], float]:
+        """Return `True` if feasible, else `False` with limiting factor.
+
+        The margin to the normal limits is returned if regula falsi is used
+        and the solution has converged, `nan` otherwise.
+        """
         limiting_factor: Optional[LimitingFactor]
-        if (violations := self.check_violations()) != Violations.NO_VIOLATIONS:
-            return False, LimitingFactor(violations, None)
+        violations: Violations
+        margin: float
+        violations, margin = check_violations_and_margin(
+            **self._normal_limits_kwargs,
+            use_full_newton_raphson=self._use_full_newton_raphson,
+            solver_opts=self._solver_opts,
+        )
+        if not self._use_regula_falsi:
+            margin = math.nan
+        if violations != Violations.NO_VIOLATIONS:
+            return False, LimitingFactor(violations, None), margin
         else:
             limiting_factor = self.contingency_check()
             if limiting_factor.v != Violations.NO_VIOLATIONS:
-                return False, limiting_factor
-        return True, None
+                return False, limiting_factor, margin
+        return True, None, margin
 
     def check_violations(self) -> Violations:
-        violations: Violations
-        if self._normal_limits is None:
-            violations = check_violations(
-                use_full_newton_raphson=self._use_full_newton_raphson,
-                solver_opts=self._solver_opts,
-            )
-        else:
-            violations = check_violations(
-                **dataclasses.asdict(self._normal_limits),
-                use_full_newton_raphson=self._use_full_newton_raphson,
-                solver_opts=self._solver_opts,
-            )
-        return violations
+        return check_violations(
+            **self._normal_limits_kwargs,
+            use_full_newton_raphson=self._use_full_newton_raphson,
+            solver_opts=self._solver_opts,
+        )
+
+    def violations_margin(self) -> float:
+        return get_violations_margin(**self._normal_limits_kwargs)
 
     def contingency_check(self) -> LimitingFactor:
         limiting_factor: LimitingFactor
@@ -347,22 +558,157 @@ class CapacityAnalyser:
             limiting_factor = get_contingency_limiting_factor(
                 contingency_scenario=self._contingency_scenario,
                 use_full_newton_raphson=self._use_full_newton_raphson,
+                first_contingency=self._last_limiting_contingency,
+                all_enabled=True,
             )
         else:
             limiting_factor = get_contingency_limiting_factor(
                 contingency_scenario=self._contingency_scenario,
                 use_full_newton_raphson=self._use_full_newton_raphson,
                 contingency_limits=self._contingency_limits,
+                first_contingency=self._last_limiting_contingency,
+                all_enabled=True,
             )
+        if self._limiting_contingency_first and limiting_factor.ss is not None:
+            self._last_limiting_contingency = limiting_factor.ss
         return limiting_factor
 
 
+NextProbe = Callable[[float, float, float, float, float, float], tuple[float, float]]
+
+
+def next_probe(
+    lower_re: float,
+    lower_im: float,
+    upper_re: float,
+    upper_im: float,
+    lower_margin: float,
+    upper_margin: float,
+) -> tuple[float, float]:
+    """Return the probe between the lower and the upper limits
+
+    The probe is interpolated linearly (regula falsi) if the lower limit
+    has a positive margin and the upper limit has a negative one.
+    The middle point is probed (bisection) otherwise, e.g. if margins are `nan`.
+    """
+    ratio: float = 0.5
+    if lower_margin > 0 > upper_margin:
+        ratio = min(
+            max(lower_margin / (lower_margin - upper_margin), MIN_PROBE_RATIO),
+            1 - MIN_PROBE_RATIO,
+        )
+    return (
+        lower_re + (upper_re - lower_re) * ratio,
+        lower_im + (upper_im - lower_im) * ratio,
+    )
+
+
+@functools.cache
+def get_next_probe_func(use_numba: bool) -> NextProbe:
+    """Return `next_probe()`, compiled by Numba if `use_numba` is set"""
+    if not use_numba:
+        return next_probe
+    # Numba is imported only if used, it takes time to import and to compile
+    import numba
+
+    # `fastmath` is not used: it assumes there are no `nan` margins
+    return numba.njit(cache=True)(next_probe)
+
+
+def get_violations_value(limiting_factor: Optional[LimitingFactor]) -> int:
+    return limiting_factor.v.value if limiting_factor is not None else 0
+
+
+def update_progress(progress: tqdm, bus_idx: int, bus: Bus) -> None:
+    if bus_idx % PROGRESS_POSTFIX_INTERVAL == 0:
+        progress.set_postfix_str(
+            f"bus_number={bus.number}, power_flows={PowerFlows.get_count()}",
+            refresh=False,
+        )
+    progress.update()
+
+
+class _WorkerCapacityAnalyser(CapacityAnalyser):
+    """Capacity analyser of a worker process
+
+    The case is opened and solved by `init_worker()`. The solver and the base
+    case violations are checked by the analyser of the main process.
+    """
+
+    def __init__(
+        self, use_full_newton_raphson: bool, capacity_analyser_kwargs: dict
+    ) -> None:
+        self._worker_use_full_newton_raphson: Final[bool] = use_full_newton_raphson
+        super().__init__(**capacity_analyser_kwargs)
+
+    def fdns_is_applicable(self) -> bool:
+        return not self._worker_use_full_newton_raphson
+
+    def check_base_case_violations(self) -> None:
+        pass
+
+
+_worker_capacity_analyser: Optional[CapacityAnalyser] = None
+
+
+def _init_headroom_worker(
+    capacity_analyser_kwargs: dict, use_full_newton_raphson: bool
+) -> None:
+    """Open the case and build the capacity analyser in the worker process"""
+    global _worker_capacity_analyser
+    init_worker(
+        capacity_analyser_kwargs["case_name"],
+        use_full_newton_raphson,
+        capacity_analyser_kwargs["solver_opts"],
+    )
+    _worker_capacity_analyser = _WorkerCapacityAnalyser(
+        use_full_newton_raphson, capacity_analyser_kwargs
+    )
+
+
+def _bus_headroom_worker(bus: Bus) -> BusHeadroomResult:
+    """Return bus headroom with the stats collected while analysing it"""
+    if _worker_capacity_analyser is None:
+        raise RuntimeError("Capacity analyser is not initialised in the worker")
+    PowerFlows.reset_count()
+    ViolationsStats.reset()
+    CapacityAnalysisStats.reset()
+    bus_headroom_values: BusHeadroomValues = (
+        _worker_capacity_analyser.bus_headroom_values(bus)
+    )
+    return BusHeadroomResult(
+        bus_headroom_values=bus_headroom_values,
+        feasibility_stats=CapacityAnalysisStats.feasibility_dict(),
+        contingency_stats=CapacityAnalysisStats.contingencies_dict(),
+        violations_stats=ViolationsStats.asdict(),
+        power_flows_count=PowerFlows.get_count(),
+    )
+
+
 class CapacityAnalysisStats:
     _feasibility_stats: dict[Bus, list[UnfeasibleCondition]] = defaultdict(list)
     _contingency_stats: dict[
         LimitingSubsystem, BusToContingencyConditions
     ] = defaultdict(bus_to_contingency_conditions)
 
+    @classmethod
+    def reset(cls) -> None:
+        cls._feasibility_stats = defaultdict(list)
+        cls._contingency_stats = defaultdict(bus_to_contingency_conditions)
+
+    @classmethod
+    def merge(
+        cls,
+        feasibility_stats: dict[Bus, list[UnfeasibleCondition]],
+        contingency_stats: dict[LimitingSubsystem, BusToContingencyConditions],
+    ) -> None:
+        """Append capacity analysis stats collected by another process"""
+        for bus, unfeasible_conditions in feasibility_stats.items():
+            cls._feasibility_stats[bus].extend(unfeasible_conditions)
+        for subsystem, bus_to_conditions in contingency_stats.items():
+            for bus, contingency_conditions in bus_to_conditions.items():
+                cls._contingency_stats[subsystem][bus].extend(contingency_conditions)
+
     @classmethod
     def update(
         cls,
@@ -424,6 +770,7 @@ class CapacityAnalysisStats:
                 pprint(dict(bus_to_contingency_conditions))
 
 
+@overload
 def buses_headroom(
     case_name: str,
     upper_load_limit_p_mw: float,
@@ -437,12 +784,117 @@ def buses_headroom(
     normal_limits: Optional[ViolationsLimits] = None,
     contingency_limits: Optional[ViolationsLimits] = None,
     contingency_scenario: Optional[ContingencyScenario] = None,
+    max_workers: Optional[int] = None,
+    use_regula_falsi: bool = False,
+    skip_swing_buses_load: bool = False,
+    contingency_group_size: int = 1,
+    use_numba: bool = False,
+    limiting_contingency_first: bool = False,
+    *,
+    legacy: Literal[True] = True,
 ) -> Headroom:
+    ...
+
+
+@overload
+def buses_headroom(
+    case_name: str,
+    upper_load_limit_p_mw: float,
+    upper_gen_limit_p_mw: float,
+    load_power_factor: float = 0.9,
+    gen_power_factor: float = 0.9,
+    selected_buses_ids: Optional[Collection[int]] = None,
+    headroom_tolerance_p_mw: float = 5.0,
+    solver_opts: dict = {"options1": 1, "options5": 1},
+    max_iterations: int = 10,
+    normal_limits: Optional[ViolationsLimits] = None,
+    contingency_limits: Optional[ViolationsLimits] = None,
+    contingency_scenario: Optional[ContingencyScenario] = None,
+    max_workers: Optional[int] = None,
+    use_regula_falsi: bool = False,
+    skip_swing_buses_load: bool = False,
+    contingency_group_size: int = 1,
+    use_numba: bool = False,
+    limiting_contingency_first: bool = False,
+    *,
+    legacy: Literal[False],
+) -> HeadroomArray:
+    ...
+
+
+@overload
+def buses_headroom(
+    case_name: str,
+    upper_load_limit_p_mw: float,
+    upper_gen_limit_p_mw: float,
+    load_power_factor: float = 0.9,
+    gen_power_factor: float = 0.9,
+    selected_buses_ids: Optional[Collection[int]] = None,
+    headroom_tolerance_p_mw: float = 5.0,
+    solver_opts: dict = {"options1": 1, "options5": 1},
+    max_iterations: int = 10,
+    normal_limits: Optional[ViolationsLimits] = None,
+    contingency_limits: Optional[ViolationsLimits] = None,
+    contingency_scenario: Optional[ContingencyScenario] = None,
+    max_workers: Optional[int] = None,
+    use_regula_falsi: bool = False,
+    skip_swing_buses_load: bool = False,
+    contingency_group_size: int = 1,
+    use_numba: bool = False,
+    limiting_contingency_first: bool = False,
+    *,
+    legacy: bool = True,
+) -> Union[Headroom, HeadroomArray]:
+    ...
+
+
+def buses_headroom(
+    case_name: str,
+    upper_load_limit_p_mw: float,
+    upper_gen_limit_p_mw: float,
+    load_power_factor: float = 0.9,
+    gen_power_factor: float = 0.9,
+    selected_buses_ids: Optional[Collection[int]] = None,
+    headroom_tolerance_p_mw: float = 5.0,
+    solver_opts: dict = {"options1": 1, "options5": 1},
+    max_iterations: int = 10,
+    normal_limits: Optional[ViolationsLimits] = None,
+    contingency_limits: Optional[ViolationsLimits] = None,
+    contingency_scenario: Optional[ContingencyScenario] = None,
+    max_workers: Optional[int] = None,
+    use_regula_falsi: bool = False,
+    skip_swing_buses_load: bool = False,
+    contingency_group_size: int = 1,
+    use_numba: bool = False,
+    limiting_contingency_first: bool = False,
+    *,
+    legacy: bool = True,
+) -> Union[Headroom, HeadroomArray]:
     """Return actual load and max additional PQ power in MVA for each bus
 
     Default solver options:
         `options1=1` Use tap adjustment option setting
         `options5=1` Use switched shunt adjustment option setting
+
+    Buses are analysed by `max_workers` processes, see `get_workers_count()`.
+
+    Headroom is searched by bisection. If `use_regula_falsi` is set,
+    the probes are interpolated using the margins to the normal limits.
+
+    If `skip_swing_buses_load` is set, load headroom of the swing buses
+    isn't analysed and is reported as zero.
+
+    If no contingency scenario is provided, it is built disabling
+    `contingency_group_size` branches or trafos at once first.
+
+    If `use_numba` is set, the probes computation is compiled by Numba.
+
+    If `limiting_contingency_first` is set, the last contingency with violations
+    is checked first on the next probes of the same headroom search.
+    Another contingency could be reported as the limiting one.
+
+    If `legacy` is not set, the headroom is returned as a structured array
+    with `HEADROOM_DTYPE`.
     """
     capacity_analyser: CapacityAnalyser = CapacityAnalyser(
         case_name,
@@ -457,5 +909,11 @@ def buses_headroom(
         normal_limits,
         contingency_limits,
         contingency_scenario,
+        max_workers,
+        use_regula_falsi,
+        skip_swing_buses_load,
+        contingency_group_size,
+        use_numba,
+        limiting_contingency_first,
     )
-    return capacity_analyser.buses_headroom()
+    return capacity_analyser.buses_headroom(legacy)
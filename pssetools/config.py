@@ -52,6 +52,12 @@ class ConfigModel(BaseModel):
         trafo_rate="Rate1",
     )
     contingency_scenario: Optional[ContingencyScenario]
+    max_workers: Optional[PositiveInt]
+    use_regula_falsi: Optional[bool] = False
+    skip_swing_buses_load: Optional[bool] = False
+    contingency_group_size: Optional[PositiveInt] = 1
+    use_numba: Optional[bool] = False
+    limiting_contingency_first: Optional[bool] = False
 
 
 def load_config_model(config_file_name: str) -> ConfigModel:
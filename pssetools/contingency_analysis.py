@@ -14,9 +14,16 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import dataclasses
+import functools
+import itertools
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AbstractContextManager, ExitStack
 from dataclasses import dataclass
-from typing import Optional, Union
+from typing import Optional, TypeVar, Union
 
+from pssetools import wrapped_funcs as wf
+from pssetools.process_pool import get_chunksize, get_workers_count, init_worker
 from pssetools.subsystems import (
     Branch,
     Branches,
@@ -25,7 +32,12 @@ from pssetools.subsystems import (
     disable_branch,
     disable_trafo,
 )
-from pssetools.violations_analysis import Violations, ViolationsLimits, check_violations
+from pssetools.violations_analysis import (
+    Violations,
+    ViolationsLimits,
+    check_violations,
+    run_solver,
+)
 
 
 @dataclass
@@ -34,6 +46,8 @@ class ContingencyScenario:
     trafos: tuple[Trafo, ...]
 
 
+Contingency = Union[Branch, Trafo]
+# Contingency type, its buses regardless of their order, and its unpadded id
 LimitingSubsystem = Union[None, Branch, Trafo]
 
 
@@ -55,29 +69,65 @@ def get_contingency_limiting_factor(
         trafo_rate="Rate1",
     ),
     use_full_newton_raphson: bool = False,
+    first_contingency: Optional[Contingency] = None,
+    all_enabled: bool = False,
 ) -> LimitingFactor:
+    """Return the first contingency with violations
+
+    Branches are checked before trafos. If `first_contingency` is provided,
+    it is checked before all of them.
+
+    If `all_enabled` is set, the statuses of the contingencies aren't checked.
+    The scenario should contain enabled contingencies only,
+    see `get_enabled_contingency_scenario()`.
+    """
     violations: Violations = Violations.NO_VIOLATIONS
-    for branch in contingency_scenario.branches:
-        if branch.is_enabled():
-            with disable_branch(branch):
-                violations |= check_violations(
-                    **dataclasses.asdict(contingency_limits),
-                    use_full_newton_raphson=use_full_newton_raphson,
-                )
-                if violations != Violations.NO_VIOLATIONS:
-                    return LimitingFactor(violations, branch)
-    for trafo in contingency_scenario.trafos:
-        if trafo.is_enabled():
-            with disable_trafo(trafo):
+    contingency_limits_kwargs: dict = dataclasses.asdict(contingency_limits)
+    contingencies: Iterable[Contingency] = itertools.chain(
+        contingency_scenario.branches, contingency_scenario.trafos
+    )
+    if first_contingency is not None:
+        contingencies = itertools.chain(
+            (first_contingency,),
+            (
+                contingency
+                for contingency in contingencies
+                if contingency != first_contingency
+            ),
+        )
+    for contingency in contingencies:
+        if all_enabled or contingency.is_enabled():
+            with disable_contingency(contingency):
                 violations |= check_violations(
-                    **dataclasses.asdict(contingency_limits),
+                    **contingency_limits_kwargs,
                     use_full_newton_raphson=use_full_newton_raphson,
                 )
                 if violations != Violations.NO_VIOLATIONS:
-                    return LimitingFactor(violations, trafo)
+                    return LimitingFactor(violations, contingency)
     return LimitingFactor(violations, None)
 
 
+def get_enabled_contingency_scenario(
+    contingency_scenario: ContingencyScenario,
+) -> ContingencyScenario:
+    """Return the contingency scenario without disabled branches and trafos
+
+    Raises `PsseApiCallError` if any contingency isn't found in the case.
+    """
+    return ContingencyScenario(
+        tuple(
+            branch for branch in contingency_scenario.branches if branch.is_enabled()
+        ),
+        tuple(trafo for trafo in contingency_scenario.trafos if trafo.is_enabled()),
+    )
+
+
+def disable_contingency(contingency: Contingency) -> AbstractContextManager[bool]:
+    if isinstance(contingency, Branch):
+        return disable_branch(contingency)
+    return disable_trafo(contingency)
+
+
 def get_default_contingency_limits() -> ViolationsLimits:
     if (
         tuple(get_contingency_limiting_factor.__annotations__.keys())[1]
@@ -100,40 +150,154 @@ def get_contingency_scenario(
     use_full_newton_raphson: bool,
     solver_opts: dict,
     contingency_limits: Optional[ViolationsLimits] = get_default_contingency_limits(),
+    case_name: Optional[str] = None,
+    max_workers: Optional[int] = 1,
+    group_size: int = 1,
 ) -> ContingencyScenario:
-    contingency_limits = contingency_limits or get_default_contingency_limits()
+    """Return enabled branches and trafos that could be disabled without violations
+
+    If `case_name` is provided, the branches and trafos are checked
+    by `max_workers` processes, see `get_workers_count()`.
 
-    def check_contingency_limits_violations() -> Violations:
-        return check_violations(
-            **dataclasses.asdict(contingency_limits),
-            use_full_newton_raphson=use_full_newton_raphson,
-            solver_opts=solver_opts,
+    If `group_size` is greater than 1, the groups of branches and trafos
+    are disabled together first, see `contingencies_are_not_critical()`.
+    The `case_name` is required then.
+    """
+    contingency_limits = contingency_limits or get_default_contingency_limits()
+    branches: Branches = Branches()
+    enabled_branches: tuple[Branch, ...] = tuple(
+        branches[branch_idx] for branch_idx in branches.get_enabled_indexes()
+    )
+    trafos: Trafos = Trafos()
+    enabled_trafos: tuple[Trafo, ...] = tuple(
+        trafos[trafo_idx] for trafo_idx in trafos.get_enabled_indexes()
+    )
+    # Branches and trafos are never grouped together
+    contingencies_groups: tuple[tuple[Contingency, ...], ...] = (
+        *split_into_groups(enabled_branches, group_size),
+        *split_into_groups(enabled_trafos, group_size),
+    )
+    check_contingencies = functools.partial(
+        contingencies_are_not_critical,
+        contingency_limits=contingency_limits,
+        use_full_newton_raphson=use_full_newton_raphson,
+        solver_opts=solver_opts,
+        case_name=case_name,
+    )
+    workers_count: int = get_workers_count(max_workers, len(contingencies_groups))
+    groups_are_not_critical: tuple[tuple[bool, ...], ...]
+    if case_name is None or workers_count == 1:
+        groups_are_not_critical = tuple(map(check_contingencies, contingencies_groups))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers_count,
+            initializer=init_worker,
+            initargs=(case_name, use_full_newton_raphson, solver_opts),
+        ) as executor:
+            groups_are_not_critical = tuple(
+                executor.map(
+                    check_contingencies,
+                    contingencies_groups,
+                    chunksize=get_chunksize(len(contingencies_groups), workers_count),
+                )
+            )
+    not_critical_contingencies: tuple[Contingency, ...] = tuple(
+        itertools.compress(
+            (*enabled_branches, *enabled_trafos),
+            itertools.chain.from_iterable(groups_are_not_critical),
         )
+    )
+    return ContingencyScenario(
+        tuple(
+            contingency
+            for contingency in not_critical_contingencies
+            if isinstance(contingency, Branch)
+        ),
+        tuple(
+            contingency
+            for contingency in not_critical_contingencies
+            if isinstance(contingency, Trafo)
+        ),
+    )
+
 
-    def branch_is_not_critical(
-        branch: Branch,
-    ) -> bool:
-        if branch.is_enabled():
-            with disable_branch(branch) as is_disabled:
-                if is_disabled:
-                    violations: Violations = check_contingency_limits_violations()
-                    return violations == Violations.NO_VIOLATIONS
-        return False
-
-    def trafo_is_not_critical(
-        trafo: Trafo,
-    ) -> bool:
-        if trafo.is_enabled():
-            with disable_trafo(trafo) as is_disabled:
-                if is_disabled:
-                    violations: Violations = check_contingency_limits_violations()
-                    return violations == Violations.NO_VIOLATIONS
-        return False
-
-    not_critical_branches: tuple[Branch, ...] = tuple(
-        branch for branch in Branches() if branch_is_not_critical(branch)
+T = TypeVar("T")
+
+
+def split_into_groups(items: Sequence[T], group_size: int) -> tuple[tuple[T, ...], ...]:
+    return tuple(
+        tuple(items[idx : idx + group_size]) for idx in range(0, len(items), group_size)
     )
-    not_critical_trafos: tuple[Trafo, ...] = tuple(
-        trafo for trafo in Trafos() if trafo_is_not_critical(trafo)
+
+
+def contingencies_are_not_critical(
+    contingencies: tuple[Contingency, ...],
+    contingency_limits: ViolationsLimits,
+    use_full_newton_raphson: bool,
+    solver_opts: dict,
+    case_name: Optional[str] = None,
+) -> tuple[bool, ...]:
+    """Return `True` for every contingency that could be disabled without violations
+
+    The contingencies are disabled together first. If the limits are not violated,
+    disabling any single contingency is considered as not violating the limits too.
+    Otherwise, every contingency is checked separately.
+
+    If `case_name` is provided, the check starts from the reopened base case,
+    so the result doesn't depend on the contingencies checked before.
+    It is required for the groups of contingencies.
+    """
+    if len(contingencies) > 1:
+        if case_name is None:
+            raise ValueError("`case_name` is required to check contingencies groups")
+        restore_base_case(case_name, use_full_newton_raphson, solver_opts)
+        with ExitStack() as disabled_contingencies:
+            all_are_disabled: bool = all(
+                disabled_contingencies.enter_context(disable_contingency(contingency))
+                for contingency in contingencies
+            )
+            if all_are_disabled:
+                violations: Violations = check_violations(
+                    **dataclasses.asdict(contingency_limits),
+                    use_full_newton_raphson=use_full_newton_raphson,
+                    solver_opts=solver_opts,
+                )
+                if violations == Violations.NO_VIOLATIONS:
+                    return (True,) * len(contingencies)
+        # The group outage often islands the grid, the solution diverges.
+        # The base case is restored, so the separate checks don't start from it.
+        restore_base_case(case_name, use_full_newton_raphson, solver_opts)
+    elif case_name is not None:
+        restore_base_case(case_name, use_full_newton_raphson, solver_opts)
+    return tuple(
+        contingency_is_not_critical(
+            contingency, contingency_limits, use_full_newton_raphson, solver_opts
+        )
+        for contingency in contingencies
     )
-    return ContingencyScenario(not_critical_branches, not_critical_trafos)
+
+
+def contingency_is_not_critical(
+    contingency: Contingency,
+    contingency_limits: ViolationsLimits,
+    use_full_newton_raphson: bool,
+    solver_opts: dict,
+) -> bool:
+    """Return `True` if the disabled contingency doesn't violate contingency limits"""
+    with disable_contingency(contingency) as is_disabled:
+        if is_disabled:
+            violations: Violations = check_violations(
+                **dataclasses.asdict(contingency_limits),
+                use_full_newton_raphson=use_full_newton_raphson,
+                solver_opts=solver_opts,
+            )
+            return violations == Violations.NO_VIOLATIONS
+    return False
+
+
+def restore_base_case(
+    case_name: str, use_full_newton_raphson: bool, solver_opts: dict
+) -> None:
+    """Reopen and solve the case, dropping taps and shunts adjusted by outages"""
+    wf.open_case(case_name)
+    run_solver(use_full_newton_raphson, solver_opts)
@@ -0,0 +1,72 @@
+"""Helpers to run power flows in a pool of worker processes
+
+Copyright 2022 Vattenfall AB
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import sys
+from typing import Final, Optional
+
+from pssetools import wrapped_funcs as wf
+from pssetools.violations_analysis import run_solver
+
+# Every worker starts PSSE, opens and solves the case.
+# It isn't worth it for less tasks than this.
+MIN_TASKS_PER_WORKER: Final[int] = 8
+# `ProcessPoolExecutor` doesn't accept more workers on Windows
+MAX_WINDOWS_WORKERS: Final[int] = 61
+
+
+def init_worker(
+    case_name: str,
+    use_full_newton_raphson: bool,
+    solver_opts: dict,
+) -> None:
+    """Initialise PSSE and open the solved case in the worker process
+
+    PSSE state is per-process, so every worker has its own opened case.
+    """
+    # `pssetools` imports this module, so `init_psse()` is imported on the call
+    from pssetools import init_psse
+
+    init_psse()
+    wf.open_case(case_name)
+    run_solver(use_full_newton_raphson, solver_opts)
+
+
+def get_workers_count(max_workers: Optional[int], tasks_count: int) -> int:
+    """Return workers count, all CPUs are used by default
+
+    Every worker gets at least `MIN_TASKS_PER_WORKER` tasks,
+    so the small sets of tasks are run sequentially by a single worker.
+    At most `MAX_WINDOWS_WORKERS` workers are used on Windows.
+    """
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"{max_workers=} should be positive")
+    workers_limit: int = os.cpu_count() or 1
+    if sys.platform == "win32":
+        if max_workers is not None and max_workers > MAX_WINDOWS_WORKERS:
+            raise ValueError(
+                f"{max_workers=} should not exceed {MAX_WINDOWS_WORKERS} on Windows"
+            )
+        workers_limit = min(workers_limit, MAX_WINDOWS_WORKERS)
+    return max(
+        1,
+        min(max_workers or workers_limit, tasks_count // MIN_TASKS_PER_WORKER),
+    )
+
+
+def get_chunksize(tasks_count: int, workers_count: int) -> int:
+    """Return tasks count submitted to a worker at once"""
+    return max(1, tasks_count // (4 * workers_count))
@@ -14,18 +14,23 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import dataclasses
+import functools
 import logging
+import math
 from collections.abc import Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass
 from types import TracebackType
 from typing import Final, Iterator, Optional, Union, overload
 
+import numpy as np
+import numpy.typing as npt
 import psspy
 
 from pssetools import wrapped_funcs as wf
 
 log = logging.getLogger(__name__)
+SWING_BUS_TYPE: Final[int] = 3
 
 
 @dataclass(frozen=True)
@@ -44,21 +49,27 @@ class Branch:
 
 @dataclass
 class RawBranches:
-    from_number: list[int]
-    to_number: list[int]
+    from_number: npt.NDArray[np.int32]
+    to_number: npt.NDArray[np.int32]
     branch_id: list[str]
-    pct_rate: list[float]
+    pct_rate: npt.NDArray[np.float64]
 
 
 class Branches(Sequence):
     def __init__(self, rate: str = "Rate1") -> None:
         self._log = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self._rate: str = rate
-        self._raw_branches: RawBranches = RawBranches(
-            wf.abrnint(string="fromNumber")[0],
-            wf.abrnint(string="toNumber")[0],
+        self._pct_rate: npt.NDArray[np.float64] = np.asarray(
+            wf.abrnreal(string=f"pct{self._rate}")[0], dtype=np.float64
+        )
+
+    @functools.cached_property
+    def _raw_branches(self) -> RawBranches:
+        return RawBranches(
+            np.asarray(wf.abrnint(string="fromNumber")[0], dtype=np.int32),
+            np.asarray(wf.abrnint(string="toNumber")[0], dtype=np.int32),
             wf.abrnchar(string="id")[0],
-            wf.abrnreal(string=f"pct{self._rate}")[0],
+            self._pct_rate,
         )
 
     @overload
@@ -72,35 +83,46 @@ class Branches(Sequence):
     def __getitem__(self, idx: Union[int, slice]) -> Union[Branch, tuple[Branch, ...]]:
         if isinstance(idx, int):
             return Branch(
-                self._raw_branches.from_number[idx],
-                self._raw_branches.to_number[idx],
+                self._raw_branches.from_number[idx].item(),
+                self._raw_branches.to_number[idx].item(),
                 self._raw_branches.branch_id[idx],
             )
         elif isinstance(idx, slice):
             return tuple(
                 Branch(*args)
                 for args in zip(
-                    self._raw_branches.from_number[idx],
-                    self._raw_branches.to_number[idx],
+                    self._raw_branches.from_number[idx].tolist(),
+                    self._raw_branches.to_number[idx].tolist(),
                     self._raw_branches.branch_id[idx],
                 )
             )
 
     def __len__(self) -> int:
-        return len(self._raw_branches.from_number)
+        return len(self._pct_rate)
 
     def get_overloaded_indexes(self, max_branch_loading_pct: float) -> tuple[int, ...]:
-        return tuple(
-            branch_idx
-            for branch_idx, pct_rate in enumerate(self._raw_branches.pct_rate)
-            if pct_rate > max_branch_loading_pct
-        )
+        return tuple(np.flatnonzero(self._pct_rate > max_branch_loading_pct).tolist())
 
     def get_loading_pct(
         self,
         selected_indexes: tuple[int, ...],
     ) -> tuple[float, ...]:
-        return tuple(self._raw_branches.pct_rate[idx] for idx in selected_indexes)
+        return tuple(self._pct_rate.take(selected_indexes).tolist())
+
+    def get_max_loading_pct(self) -> float:
+        """Return the highest branch loading, `-inf` if there are no branches"""
+        return self._pct_rate.max(initial=-math.inf).item()
+
+    def get_enabled_indexes(self) -> tuple[int, ...]:
+        """Return indexes of enabled branches
+
+        Statuses of all branches are pulled at once instead of calling
+        `Branch.is_enabled()` for every branch.
+        """
+        status: npt.NDArray[np.int32] = np.asarray(
+            wf.abrnint(string="status")[0], dtype=np.int32
+        )
+        return tuple(np.flatnonzero(status).tolist())
 
     def log(
         self,
@@ -120,7 +142,7 @@ class Branches(Sequence):
                     tuple(
                         (
                             *dataclasses.astuple(branch),
-                            self._raw_branches.pct_rate[idx],
+                            self._raw_branches.pct_rate[idx].item(),
                         )
                     ),
                 )
@@ -156,20 +178,28 @@ class Bus:
 
 @dataclass
 class RawBuses:
-    number: list[int]
+    number: npt.NDArray[np.int32]
     ex_name: list[str]
-    type: list[int]
-    pu: list[float]
+    type: npt.NDArray[np.int32]
+    pu: npt.NDArray[np.float64]
 
 
 class Buses(Sequence):
     def __init__(self) -> None:
         self._log = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-        self._raw_buses: RawBuses = RawBuses(
-            wf.abusint(string="number")[0],
+        # Subsystems pull the solution results eagerly, the static fields
+        # are pulled on demand only
+        self._pu: npt.NDArray[np.float64] = np.asarray(
+            wf.abusreal(string="pu")[0], dtype=np.float64
+        )
+
+    @functools.cached_property
+    def _raw_buses(self) -> RawBuses:
+        return RawBuses(
+            np.asarray(wf.abusint(string="number")[0], dtype=np.int32),
             wf.abuschar(string="exName")[0],
-            wf.abusint(string="type")[0],
-            wf.abusreal(string="pu")[0],
+            np.asarray(wf.abusint(string="type")[0], dtype=np.int32),
+            self._pu,
         )
 
     @overload
@@ -183,42 +213,42 @@ class Buses(Sequence):
     def __getitem__(self, idx: Union[int, slice]) -> Union[Bus, tuple[Bus, ...]]:
         if isinstance(idx, int):
             return Bus(
-                self._raw_buses.number[idx],
+                self._raw_buses.number[idx].item(),
                 self._raw_buses.ex_name[idx],
-                self._raw_buses.type[idx],
+                self._raw_buses.type[idx].item(),
             )
         elif isinstance(idx, slice):
             return tuple(
                 Bus(*args)
                 for args in zip(
-                    self._raw_buses.number[idx],
+                    self._raw_buses.number[idx].tolist(),
                     self._raw_buses.ex_name[idx],
-                    self._raw_buses.type[idx],
+                    self._raw_buses.type[idx].tolist(),
                 )
             )
 
     def __len__(self) -> int:
-        return len(self._raw_buses.number)
+        return len(self._pu)
 
     def get_overvoltage_indexes(self, max_bus_voltage: float) -> tuple[int, ...]:
-        return tuple(
-            bus_id
-            for bus_id, pu_voltage in enumerate(self._raw_buses.pu)
-            if pu_voltage > max_bus_voltage
-        )
+        return tuple(np.flatnonzero(self._pu > max_bus_voltage).tolist())
 
     def get_undervoltage_indexes(self, min_bus_voltage: float) -> tuple[int, ...]:
-        return tuple(
-            bus_id
-            for bus_id, pu_voltage in enumerate(self._raw_buses.pu)
-            if pu_voltage < min_bus_voltage
-        )
+        return tuple(np.flatnonzero(self._pu < min_bus_voltage).tolist())
 
     def get_voltage_pu(
         self,
         selected_indexes: tuple[int, ...],
     ) -> tuple[float, ...]:
-        return tuple(self._raw_buses.pu[idx] for idx in selected_indexes)
+        return tuple(self._pu.take(selected_indexes).tolist())
+
+    def get_max_voltage_pu(self) -> float:
+        """Return the highest bus voltage, `-inf` if there are no buses"""
+        return self._pu.max(initial=-math.inf).item()
+
+    def get_min_voltage_pu(self) -> float:
+        """Return the lowest bus voltage, `inf` if there are no buses"""
+        return self._pu.min(initial=math.inf).item()
 
     def log(
         self,
@@ -233,7 +263,7 @@ class Buses(Sequence):
             if selected_indexes is None or idx in selected_indexes:
                 self._log.log(
                     level,
-                    tuple((*dataclasses.astuple(bus), self._raw_buses.pu[idx])),
+                    tuple((*dataclasses.astuple(bus), self._raw_buses.pu[idx].item())),
                 )
         self._log.log(level, bus_fields)
 
@@ -248,33 +278,43 @@ class Load:
 
 @dataclass(frozen=True)
 class RawLoads:
-    number: list[int]
+    number: npt.NDArray[np.int32]
     ex_name: list[str]
     load_id: list[str]
-    mva_act: list[complex]
+    mva_act: npt.NDArray[np.complex128]
 
 
 class Loads:
     def __init__(self) -> None:
         self._raw_loads: RawLoads = RawLoads(
-            wf.aloadint(string="number")[0],
+            np.asarray(wf.aloadint(string="number")[0], dtype=np.int32),
             wf.aloadchar(string="exName")[0],
             wf.aloadchar(string="id")[0],
-            wf.aloadcplx(string="mvaAct")[0],
+            np.asarray(wf.aloadcplx(string="mvaAct")[0], dtype=np.complex128),
         )
 
     def __iter__(self) -> Iterator[Load]:
-        for load_idx in range(len(self)):
-            yield Load(
-                self._raw_loads.number[load_idx],
-                self._raw_loads.ex_name[load_idx],
-                self._raw_loads.load_id[load_idx],
-                self._raw_loads.mva_act[load_idx],
-            )
+        for args in zip(
+            self._raw_loads.number.tolist(),
+            self._raw_loads.ex_name,
+            self._raw_loads.load_id,
+            self._raw_loads.mva_act.tolist(),
+        ):
+            yield Load(*args)
 
     def __len__(self) -> int:
         return len(self._raw_loads.number)
 
+    def numbers(self) -> npt.NDArray[np.int32]:
+        return self._raw_loads.number
+
+    def mva_act_array(self) -> npt.NDArray[np.complex128]:
+        return self._raw_loads.mva_act
+
+    def aggregate_by_bus(self) -> dict[int, complex]:
+        """Return sum of actual loads by bus number"""
+        return _sum_by_bus(self._raw_loads.number, self._raw_loads.mva_act)
+
 
 @dataclass(frozen=True)
 class Machine:
@@ -286,33 +326,61 @@ class Machine:
 
 @dataclass(frozen=True)
 class RawMachines:
-    number: list[int]
+    number: npt.NDArray[np.int32]
     ex_name: list[str]
     machine_id: list[str]
-    pq_gen: list[complex]
+    pq_gen: npt.NDArray[np.complex128]
 
 
 class Machines:
     def __init__(self) -> None:
         self._raw_machines: RawMachines = RawMachines(
-            wf.amachint(string="number")[0],
+            np.asarray(wf.amachint(string="number")[0], dtype=np.int32),
             wf.amachchar(string="exName")[0],
             wf.amachchar(string="id")[0],
-            wf.amachcplx(string="pqGen")[0],
+            np.asarray(wf.amachcplx(string="pqGen")[0], dtype=np.complex128),
         )
 
     def __iter__(self) -> Iterator[Machine]:
-        for machine_idx in range(len(self)):
-            yield Machine(
-                self._raw_machines.number[machine_idx],
-                self._raw_machines.ex_name[machine_idx],
-                self._raw_machines.machine_id[machine_idx],
-                self._raw_machines.pq_gen[machine_idx],
-            )
+        for args in zip(
+            self._raw_machines.number.tolist(),
+            self._raw_machines.ex_name,
+            self._raw_machines.machine_id,
+            self._raw_machines.pq_gen.tolist(),
+        ):
+            yield Machine(*args)
 
     def __len__(self) -> int:
         return len(self._raw_machines.number)
 
+    def numbers(self) -> npt.NDArray[np.int32]:
+        return self._raw_machines.number
+
+    def pq_gen_array(self) -> npt.NDArray[np.complex128]:
+        return self._raw_machines.pq_gen
+
+    def aggregate_by_bus(self) -> dict[int, complex]:
+        """Return sum of machines generation by bus number"""
+        return _sum_by_bus(self._raw_machines.number, self._raw_machines.pq_gen)
+
+
+def _sum_by_bus(
+    numbers: npt.NDArray[np.int32], values: npt.NDArray[np.complex128]
+) -> dict[int, complex]:
+    """Return sum of values by bus number
+
+    Values are sorted by bus number and summed by the runs of equal numbers.
+    """
+    if not len(numbers):
+        return {}
+    order: npt.NDArray[np.intp] = np.argsort(numbers, kind="stable")
+    sorted_numbers: npt.NDArray[np.int32] = numbers[order]
+    run_starts: npt.NDArray[np.intp] = np.concatenate(
+        ([0], np.flatnonzero(np.diff(sorted_numbers)) + 1)
+    )
+    sums: npt.NDArray[np.complex128] = np.add.reduceat(values[order], run_starts)
+    return dict(zip(sorted_numbers[run_starts].tolist(), sums.tolist()))
+
 
 class TemporaryBusLoad:
     TEMP_LOAD_ID: str = "Tm"
@@ -320,14 +388,12 @@ class TemporaryBusLoad:
     def __init__(self, bus: Bus) -> None:
         self._bus: Bus = bus
         self._load_mva: complex
+        # PQ power list is allocated once and updated in place on every call
+        self._realar: Final[list[float]] = [0.0, 0.0]
 
     def __enter__(self) -> None:
         # Create load
-        wf.load_data_6(
-            self._bus.number,
-            self.TEMP_LOAD_ID,
-            realar=[self._load_mva.real, self._load_mva.imag],
-        )
+        wf.load_data_6(self._bus.number, self.TEMP_LOAD_ID, realar=self._realar)
 
     def __exit__(
         self,
@@ -340,6 +406,8 @@ class TemporaryBusLoad:
 
     def __call__(self, load_mva: complex) -> "TemporaryBusLoad":
         self._load_mva = load_mva
+        self._realar[0] = load_mva.real
+        self._realar[1] = load_mva.imag
         return self
 
     @property
@@ -357,14 +425,11 @@ class TemporaryBusMachine:
     def __init__(self, bus: Bus) -> None:
         self._bus: Bus = bus
         self._gen_mva: complex
+        self._realar: Final[list[float]] = [0.0, 0.0]
 
     def __enter__(self) -> None:
         # Create machine
-        wf.machine_data_4(
-            self._bus.number,
-            self.TEMP_MACHINE_ID,
-            realar=[self._gen_mva.real, self._gen_mva.imag],
-        )
+        wf.machine_data_4(self._bus.number, self.TEMP_MACHINE_ID, realar=self._realar)
 
     def __exit__(
         self,
@@ -377,6 +442,8 @@ class TemporaryBusMachine:
 
     def __call__(self, gen_mva: complex) -> "TemporaryBusMachine":
         self._gen_mva = gen_mva
+        self._realar[0] = gen_mva.real
+        self._realar[1] = gen_mva.imag
         return self
 
     @property
@@ -409,7 +476,6 @@ class SwingBuses(Sequence):
         self._log = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         # PSSE returns all buses, not only swing buses
         # Filter out all buses except swing buses (`type==3`)
-        swing_bus_type: Final[int] = 3
         self._raw_buses: RawSwingBuses = RawSwingBuses(
             *zip(
                 *(
@@ -420,7 +486,7 @@ class SwingBuses(Sequence):
                         wf.agenbusreal(string="mva")[0],
                         wf.agenbusint(string="type")[0],
                     )
-                    if bus_type == swing_bus_type
+                    if bus_type == SWING_BUS_TYPE
                 )
             )
         )
@@ -466,6 +532,10 @@ class SwingBuses(Sequence):
     ) -> tuple[float, ...]:
         return tuple(self._raw_buses.mva[idx] for idx in selected_indexes)
 
+    def get_max_power_mva(self) -> float:
+        """Return the highest swing bus power, `-inf` if there are no swing buses"""
+        return max(self._raw_buses.mva, default=-math.inf)
+
     def log(
         self,
         level: int,
@@ -514,11 +584,15 @@ class Trafos(Sequence):
     def __init__(self, rate: str = "Rate1") -> None:
         self._log = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self._rate: str = rate
-        self._raw_trafos: RawTrafos = RawTrafos(
+        self._pct_rate: list[float] = wf.atrnreal(string=f"pct{self._rate}")[0]
+
+    @functools.cached_property
+    def _raw_trafos(self) -> RawTrafos:
+        return RawTrafos(
             wf.atrnint(string="fromNumber")[0],
             wf.atrnint(string="toNumber")[0],
             wf.atrnchar(string="id")[0],
-            wf.atrnreal(string=f"pct{self._rate}")[0],
+            self._pct_rate,
         )
 
     @overload
@@ -547,12 +621,12 @@ class Trafos(Sequence):
             )
 
     def __len__(self) -> int:
-        return len(self._raw_trafos.from_number)
+        return len(self._pct_rate)
 
     def get_overloaded_indexes(self, max_trafo_loading_pct: float) -> tuple[int, ...]:
         return tuple(
             trafo_idx
-            for trafo_idx, pct_rate in enumerate(self._raw_trafos.pct_rate)
+            for trafo_idx, pct_rate in enumerate(self._pct_rate)
             if pct_rate > max_trafo_loading_pct
         )
 
@@ -560,7 +634,19 @@ class Trafos(Sequence):
         self,
         selected_indexes: tuple[int, ...],
     ) -> tuple[float, ...]:
-        return tuple(self._raw_trafos.pct_rate[idx] for idx in selected_indexes)
+        return tuple(self._pct_rate[idx] for idx in selected_indexes)
+
+    def get_max_loading_pct(self) -> float:
+        """Return the highest trafo loading, `-inf` if there are no trafos"""
+        return max(self._pct_rate, default=-math.inf)
+
+    def get_enabled_indexes(self) -> tuple[int, ...]:
+        """Return indexes of enabled trafos, see `Branches.get_enabled_indexes()`"""
+        return tuple(
+            trafo_idx
+            for trafo_idx, status in enumerate(wf.atrnint(string="status")[0])
+            if status != 0
+        )
 
     def log(
         self,
@@ -636,12 +722,16 @@ class Trafos3w(Sequence):
     def __init__(self, rate: str = "Rate1") -> None:
         self._log = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self._rate: str = rate
-        self._raw_trafos: RawTrafos3w = RawTrafos3w(
+        self._pct_rate: list[float] = wf.awndreal(string=f"pct{self._rate}")[0]
+
+    @functools.cached_property
+    def _raw_trafos(self) -> RawTrafos3w:
+        return RawTrafos3w(
             wf.awndint(string="wind1Number")[0],
             wf.awndint(string="wind2Number")[0],
             wf.awndint(string="wind3Number")[0],
             wf.awndchar(string="id")[0],
-            wf.awndreal(string=f"pct{self._rate}")[0],
+            self._pct_rate,
         )
 
     @overload
@@ -674,12 +764,12 @@ class Trafos3w(Sequence):
             )
 
     def __len__(self) -> int:
-        return len(self._raw_trafos.wind1_number)
+        return len(self._pct_rate)
 
     def get_overloaded_indexes(self, max_trafo_loading_pct: float) -> tuple[int, ...]:
         return tuple(
             trafo_idx
-            for trafo_idx, pct_rate in enumerate(self._raw_trafos.pct_rate)
+            for trafo_idx, pct_rate in enumerate(self._pct_rate)
             if pct_rate > max_trafo_loading_pct
         )
 
@@ -687,7 +777,11 @@ class Trafos3w(Sequence):
         self,
         selected_indexes: tuple[int, ...],
     ) -> tuple[float, ...]:
-        return tuple(self._raw_trafos.pct_rate[idx] for idx in selected_indexes)
+        return tuple(self._pct_rate[idx] for idx in selected_indexes)
+
+    def get_max_loading_pct(self) -> float:
+        """Return the highest trafo loading, `-inf` if there are no trafos"""
+        return max(self._pct_rate, default=-math.inf)
 
     def log(
         self,
@@ -15,6 +15,7 @@ limitations under the License.
 """
 import enum
 import logging
+import math
 import os
 from collections import defaultdict
 from collections.abc import Callable, Collection
@@ -49,8 +50,12 @@ class PowerFlows:
         return cls._power_flows_count
 
     @classmethod
-    def increment_count(cls) -> None:
-        cls._power_flows_count += 1
+    def get_count(cls) -> int:
+        return cls._power_flows_count
+
+    @classmethod
+    def increment_count(cls, count: int = 1) -> None:
+        cls._power_flows_count += count
 
     @classmethod
     def reset_count(cls) -> None:
@@ -84,10 +89,13 @@ LimitValueToSubsystem = dict[float, SubsystemIdxToViolationValues]
 ViolationTypeToLimitValue = dict[Violations, LimitValueToSubsystem]
 
 
-def limit_value_to_subsystem() -> LimitValueToSubsystem:
-    def subsystem_idx_to_violation_values() -> SubsystemIdxToViolationValues:
-        return defaultdict(list)
+def subsystem_idx_to_violation_values() -> SubsystemIdxToViolationValues:
+    return defaultdict(list)
+
 
+def limit_value_to_subsystem() -> LimitValueToSubsystem:
+    # Default factories are module level functions
+    # to pickle the stats collected by the worker processes
     return defaultdict(subsystem_idx_to_violation_values)
 
 
@@ -106,6 +114,16 @@ class ViolationsStats:
     def is_empty(cls) -> bool:
         return len(cls._violations_stats.keys()) == 0
 
+    @classmethod
+    def merge(cls, violations_stats: ViolationTypeToLimitValue) -> None:
+        """Append violations stats collected by another process"""
+        for violation, limit_value_to_ss_violations in violations_stats.items():
+            for limit, ss_violations in limit_value_to_ss_violations.items():
+                for ss_idx, violated_values in ss_violations.items():
+                    cls._violations_stats[violation][limit][ss_idx].extend(
+                        violated_values
+                    )
+
     @classmethod
     def append_violations(
         cls,
@@ -193,12 +211,41 @@ def check_violations(
     `options1=1` Use tap adjustment option setting
     `options5=1` Use switched shunt adjustment option setting
     """
+    return check_violations_and_margin(
+        max_bus_voltage_pu,
+        min_bus_voltage_pu,
+        max_branch_loading_pct,
+        max_trafo_loading_pct,
+        max_swing_bus_power_mva,
+        branch_rate,
+        trafo_rate,
+        use_full_newton_raphson,
+        solver_opts,
+    )[0]
+
+
+def check_violations_and_margin(
+    max_bus_voltage_pu: float = 1.1,
+    min_bus_voltage_pu: float = 0.9,
+    max_branch_loading_pct: float = 100.0,
+    max_trafo_loading_pct: float = 100.0,
+    max_swing_bus_power_mva: float = 1000.0,
+    branch_rate: str = "Rate1",
+    trafo_rate: str = "Rate1",
+    use_full_newton_raphson: bool = False,
+    solver_opts: dict = {"options1": 1, "options5": 1},
+) -> tuple[Violations, float]:
+    """Return violations and the margin to the limits, see `get_violations_margin()`
+
+    The margin is computed from the same subsystems data as the violations.
+    It is `nan` if the solution has not converged.
+    """
     run_solver(use_full_newton_raphson, solver_opts)
     v: Violations = Violations.NO_VIOLATIONS
     if not wf.is_solved():
         v |= Violations.NOT_CONVERGED
         log.log(LOG_LEVEL, "Case not solved!")
-        return v
+        return v, math.nan
     log.info(f"\nCHECKING VIOLATIONS")
     buses: Buses = Buses()
     if overvoltage_buses_indexes := buses.get_overvoltage_indexes(max_bus_voltage_pu):
@@ -261,7 +308,90 @@ def check_violations(
             swing_buses,
             overloaded_swing_buses_indexes,
         )
-    return v
+    return v, get_subsystems_margin(
+        buses,
+        branches,
+        trafos,
+        trafos3w,
+        swing_buses,
+        max_bus_voltage_pu,
+        min_bus_voltage_pu,
+        max_branch_loading_pct,
+        max_trafo_loading_pct,
+        max_swing_bus_power_mva,
+    )
+
+
+def get_violations_margin(
+    max_bus_voltage_pu: float = 1.1,
+    min_bus_voltage_pu: float = 0.9,
+    max_branch_loading_pct: float = 100.0,
+    max_trafo_loading_pct: float = 100.0,
+    max_swing_bus_power_mva: float = 1000.0,
+    branch_rate: str = "Rate1",
+    trafo_rate: str = "Rate1",
+) -> float:
+    """Return the lowest margin to the limits of the solved case
+
+    Every margin is relative to its limit. The margin is negative
+    if the limit is violated.
+    """
+    return get_subsystems_margin(
+        Buses(),
+        Branches(branch_rate),
+        Trafos(trafo_rate),
+        Trafos3w(trafo_rate),
+        SwingBuses(),
+        max_bus_voltage_pu,
+        min_bus_voltage_pu,
+        max_branch_loading_pct,
+        max_trafo_loading_pct,
+        max_swing_bus_power_mva,
+    )
+
+
+def get_subsystems_margin(
+    buses: Buses,
+    branches: Branches,
+    trafos: Trafos,
+    trafos3w: Trafos3w,
+    swing_buses: SwingBuses,
+    max_bus_voltage_pu: float,
+    min_bus_voltage_pu: float,
+    max_branch_loading_pct: float,
+    max_trafo_loading_pct: float,
+    max_swing_bus_power_mva: float,
+) -> float:
+    """Return the lowest margin to the limits of the pulled subsystems data"""
+    return min(
+        relative_margin(
+            max_bus_voltage_pu - buses.get_max_voltage_pu(), max_bus_voltage_pu
+        ),
+        relative_margin(
+            buses.get_min_voltage_pu() - min_bus_voltage_pu, min_bus_voltage_pu
+        ),
+        relative_margin(
+            max_branch_loading_pct - branches.get_max_loading_pct(),
+            max_branch_loading_pct,
+        ),
+        relative_margin(
+            max_trafo_loading_pct - trafos.get_max_loading_pct(),
+            max_trafo_loading_pct,
+        ),
+        relative_margin(
+            max_trafo_loading_pct - trafos3w.get_max_loading_pct(),
+            max_trafo_loading_pct,
+        ),
+        relative_margin(
+            max_swing_bus_power_mva - swing_buses.get_max_power_mva(),
+            max_swing_bus_power_mva,
+        ),
+    )
+
+
+def relative_margin(margin: float, limit: float) -> float:
+    """Return the margin relative to the limit, the absolute one for zero limit"""
+    return margin / abs(limit) if limit != 0 else margin
 
 
 def run_solver(
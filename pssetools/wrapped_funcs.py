@@ -335,6 +335,11 @@ def rsol() -> None:
     pass  # Functionality is implemented by wrapped PSSE API function
 
 
+@process_psse_api_error_code
+def save() -> None:
+    pass  # Functionality is implemented by wrapped PSSE API function
+
+
 @process_psse_api_error_code
 def solved() -> None:
     pass  # Functionality is implemented by wrapped PSSE API function
@@ -14,3 +14,4 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 DEFAULT_CASE = "savnw.sav"
+RAW_CASE = "savnw.raw"
@@ -14,27 +14,31 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import unittest
+from typing import Optional
 
 import pssetools
 from pssetools.capacity_analysis import (
     CapacityAnalysisStats,
     Headroom,
+    HeadroomArray,
     UnfeasibleCondition,
     buses_headroom,
 )
 from pssetools.contingency_analysis import ContingencyScenario, LimitingFactor
 from pssetools.subsystems import Branch, Bus, Trafo
-from pssetools.violations_analysis import Violations, ViolationsLimits
-from tests import DEFAULT_CASE
+from pssetools.violations_analysis import PowerFlows, Violations, ViolationsLimits
+from tests import DEFAULT_CASE, RAW_CASE
 
 
 class TestCapacityAnalysis(unittest.TestCase):
+    headroom_kwargs: dict
     headroom: Headroom
+    power_flows_count: int
 
     @classmethod
     def setUpClass(cls) -> None:
         pssetools.init_psse()
-        cls.headroom = buses_headroom(
+        cls.headroom_kwargs = dict(
             case_name=DEFAULT_CASE,
             upper_load_limit_p_mw=100.0,
             upper_gen_limit_p_mw=80.0,
@@ -63,6 +67,8 @@ class TestCapacityAnalysis(unittest.TestCase):
                 trafos=(Trafo(3001, 3002), Trafo(3004, 3005)),
             ),
         )
+        cls.headroom = buses_headroom(**cls.headroom_kwargs)
+        cls.power_flows_count = PowerFlows.get_count()
 
     def test_capacity_analysis_stats(self) -> None:
         self.assertEqual(0, len(CapacityAnalysisStats.contingencies_dict()))
@@ -109,6 +115,76 @@ class TestCapacityAnalysis(unittest.TestCase):
             with self.subTest(bus_idx=bus_idx, gen_avail_mva=gen_avail_mva):
                 self.assertEqual(gen_avail_mva, self.headroom[bus_idx].gen_avail_mva)
 
+    def test_headroom_array(self) -> None:
+        headroom_array: HeadroomArray = buses_headroom(
+            **self.headroom_kwargs, legacy=False
+        )
+        self.assertEqual(len(self.headroom), len(headroom_array))
+        for bus_headroom, bus_headroom_record in zip(self.headroom, headroom_array):
+            with self.subTest(bus=bus_headroom.bus):
+                self.assertEqual(
+                    bus_headroom.bus.number, bus_headroom_record["bus_number"]
+                )
+                for field_name in (
+                    "actual_load_mva",
+                    "actual_gen_mva",
+                    "load_avail_mva",
+                    "gen_avail_mva",
+                ):
+                    self.assertEqual(
+                        getattr(bus_headroom, field_name),
+                        bus_headroom_record[field_name],
+                    )
+                for field_name in ("load_lf", "gen_lf"):
+                    lf: Optional[LimitingFactor] = getattr(bus_headroom, field_name)
+                    self.assertEqual(
+                        lf.v.value if lf is not None else 0,
+                        bus_headroom_record[f"{field_name}_v"],
+                    )
+
+    def test_raw_case_headroom(self) -> None:
+        # The `.raw` case is saved to a snapshot, that is opened by the workers
+        raw_case_headroom: Headroom = buses_headroom(
+            **{**self.headroom_kwargs, "case_name": RAW_CASE}
+        )
+        self.assertEqual(len(self.headroom), len(raw_case_headroom))
+        for bus_headroom, raw_case_bus_headroom in zip(
+            self.headroom, raw_case_headroom
+        ):
+            with self.subTest(bus=bus_headroom.bus):
+                self.assertEqual(
+                    bus_headroom.load_avail_mva, raw_case_bus_headroom.load_avail_mva
+                )
+                self.assertEqual(
+                    bus_headroom.gen_avail_mva, raw_case_bus_headroom.gen_avail_mva
+                )
+
+    def test_regula_falsi_headroom(self) -> None:
+        headroom_tolerance_p_mw: float = 5.0
+        regula_falsi_headroom: Headroom = buses_headroom(
+            **self.headroom_kwargs, use_regula_falsi=True
+        )
+        self.assertLessEqual(PowerFlows.get_count(), self.power_flows_count)
+        self.assertEqual(len(self.headroom), len(regula_falsi_headroom))
+        for bus_headroom, regula_falsi_bus_headroom in zip(
+            self.headroom, regula_falsi_headroom
+        ):
+            with self.subTest(bus=bus_headroom.bus):
+                self.assertLess(
+                    abs(
+                        bus_headroom.load_avail_mva.real
+                        - regula_falsi_bus_headroom.load_avail_mva.real
+                    ),
+                    headroom_tolerance_p_mw,
+                )
+                self.assertLess(
+                    abs(
+                        bus_headroom.gen_avail_mva.real
+                        - regula_falsi_bus_headroom.gen_avail_mva.real
+                    ),
+                    headroom_tolerance_p_mw,
+                )
+
     def test_runtime_error(self) -> None:
         # expecting RuntimeError Violations.TRAFO_LOADING
         with self.assertRaises(RuntimeError):
@@ -118,6 +194,11 @@ class TestCapacityAnalysis(unittest.TestCase):
                 upper_gen_limit_p_mw=80.0,
             )
 
+    def test_sequential_headroom(self) -> None:
+        self.assertEqual(
+            self.headroom, buses_headroom(**self.headroom_kwargs, max_workers=1)
+        )
+
     def test_violated_bus_count(self) -> None:
         self.assertEqual(
             23,
@@ -31,6 +31,18 @@ class TestContingencyAnalysis(unittest.TestCase):
             ),
         )
 
+    def test_get_contingency_limiting_factor_first_contingency(self) -> None:
+        self.assertEqual(
+            LimitingFactor(
+                Violations.BRANCH_LOADING | Violations.BUS_UNDERVOLTAGE,
+                ss=Branch(154, 205),
+            ),
+            get_contingency_limiting_factor(
+                ContingencyScenario(branches=(Branch(151, 152, "2 "),), trafos=()),
+                first_contingency=Branch(154, 205),
+            ),
+        )
+
     def test_get_default_contingency_limits(self) -> None:
         self.assertEqual(
             ViolationsLimits(
@@ -63,3 +75,33 @@ class TestContingencyAnalysis(unittest.TestCase):
             ),
             get_contingency_scenario(False, {"options1": 1, "options5": 1}),
         )
+
+    def test_get_contingency_scenario_by_groups(self) -> None:
+        self.assertEqual(
+            get_contingency_scenario(
+                False, {"options1": 1, "options5": 1}, case_name=DEFAULT_CASE
+            ),
+            get_contingency_scenario(
+                False,
+                {"options1": 1, "options5": 1},
+                case_name=DEFAULT_CASE,
+                group_size=4,
+            ),
+        )
+        with self.assertRaises(ValueError):
+            get_contingency_scenario(
+                False, {"options1": 1, "options5": 1}, group_size=4
+            )
+
+    def test_get_contingency_scenario_by_workers(self) -> None:
+        self.assertEqual(
+            get_contingency_scenario(
+                False, {"options1": 1, "options5": 1}, case_name=DEFAULT_CASE
+            ),
+            get_contingency_scenario(
+                False,
+                {"options1": 1, "options5": 1},
+                case_name=DEFAULT_CASE,
+                max_workers=2,
+            ),
+        )